@@ -5,6 +5,8 @@ import IPython
 
 
 _DATAFRAME_REGISTRY = None
+_MAX_COLNAME_COMBINATIONS = 64  # Column pairs/combinations per chart type.
+_NUMERIC_AGGREGATES = ('count()',)  # Time series values derived by aggregation.
 
 
 def find_charts(
@@ -27,8 +29,9 @@ def find_charts(
   def _ensure_dataframe_registry():
     global _DATAFRAME_REGISTRY
     if _DATAFRAME_REGISTRY is None:
-      if IPython.get_ipython():
-        variable_namespace = IPython.get_ipython().user_ns
+      shell = IPython.get_ipython()
+      if shell:
+        variable_namespace = shell.user_ns
       else:  # Fallback to placeholder namespace in testing environment.
         variable_namespace = {}
       _DATAFRAME_REGISTRY = _quickchart_helpers.DataframeRegistry(
@@ -74,70 +77,78 @@ def determine_charts(df, dataframe_registry, max_chart_instances=None):
   time_cols = dtype_groups['datetime'] + dtype_groups['timelike']
   chart_sections = []
 
-  if numeric_cols:
-    section = _quickchart_helpers.histograms_section(
-        df, numeric_cols[:max_chart_instances], dataframe_registry
+  # Column selections are materialized up front so that section builders are
+  # only invoked when they have at least one chart to generate.
+  selected_numeric_cols = numeric_cols[:max_chart_instances]
+  selected_categorical_cols = categorical_cols[:max_chart_instances]
+
+  if selected_numeric_cols:
+    chart_sections.append(
+        _quickchart_helpers.histograms_section(
+            df, selected_numeric_cols, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
 
-  if categorical_cols:
-    selected_categorical_cols = categorical_cols[:max_chart_instances]
-    section = _quickchart_helpers.categorical_histograms_section(
-        df, selected_categorical_cols, dataframe_registry
+  if selected_categorical_cols:
+    chart_sections.append(
+        _quickchart_helpers.categorical_histograms_section(
+            df, selected_categorical_cols, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
-
-  if len(numeric_cols) >= 2:
-    section = _quickchart_helpers.scatter_section(
-        df,
-        _select_first_k_pairs(numeric_cols, k=max_chart_instances),
-        dataframe_registry,
+
+  numeric_pairs = list(
+      _select_first_k_pairs(numeric_cols, k=max_chart_instances)
+  )
+  if numeric_pairs:
+    chart_sections.append(
+        _quickchart_helpers.scatter_section(
+            df, numeric_pairs, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
-
-  if time_cols:
-    section = _quickchart_helpers.time_series_line_plots_section(
-        df,
-        _select_time_series_cols(
-            time_cols=time_cols,
-            numeric_cols=numeric_cols,
-            categorical_cols=categorical_cols,
-            k=max_chart_instances,
-        ),
-        dataframe_registry,
+
+  time_series_cols = list(
+      _select_time_series_cols(
+          time_cols=time_cols,
+          numeric_cols=numeric_cols,
+          categorical_cols=categorical_cols,
+          k=max_chart_instances,
+      )
+  )
+  if time_series_cols:
+    chart_sections.append(
+        _quickchart_helpers.time_series_line_plots_section(
+            df, time_series_cols, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
 
-  if numeric_cols:
-    section = _quickchart_helpers.value_plots_section(
-        df, numeric_cols[:max_chart_instances], dataframe_registry
+  if selected_numeric_cols:
+    chart_sections.append(
+        _quickchart_helpers.value_plots_section(
+            df, selected_numeric_cols, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
-
-  if len(categorical_cols) >= 2:
-    section = _quickchart_helpers.heatmaps_section(
-        df,
-        _select_first_k_pairs(categorical_cols, k=max_chart_instances),
-        dataframe_registry,
+
+  categorical_pairs = list(
+      _select_first_k_pairs(categorical_cols, k=max_chart_instances)
+  )
+  if categorical_pairs:
+    chart_sections.append(
+        _quickchart_helpers.heatmaps_section(
+            df, categorical_pairs, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
-
-  if categorical_cols and numeric_cols:
-    section = _quickchart_helpers.faceted_distributions_section(
-        df,
-        _select_faceted_numeric_cols(
-            numeric_cols, categorical_cols, k=max_chart_instances
-        ),
-        dataframe_registry,
+
+  faceted_cols = list(
+      _select_faceted_numeric_cols(
+          numeric_cols, categorical_cols, k=max_chart_instances
+      )
+  )
+  if faceted_cols:
+    chart_sections.append(
+        _quickchart_helpers.faceted_distributions_section(
+            df, faceted_cols, dataframe_registry
+        )
     )
-    if section.charts:
-      chart_sections.append(section)
 
   return chart_sections
 
@@ -149,12 +160,13 @@ def _select_first_k_pairs(colnames, k=None):
 
   Args:
     colnames: (iterable<str>) Column names from which to generate pairs.
-    k: (int) The number of column pairs.
+    k: (int) The number of column pairs; at most _MAX_COLNAME_COMBINATIONS
+      pairs are selected, including when k is None.
 
   Returns:
-    (list<(str, str)>) A k-length sequence of column name pairs.
+    (iter<(str, str)>) A k-length sequence of column name pairs.
   """
-  return itertools.islice(itertools.pairwise(colnames), k)
+  return itertools.islice(itertools.pairwise(colnames), _bounded_count(k))
 
 
 def _select_faceted_numeric_cols(numeric_cols, categorical_cols, k=None):
@@ -163,13 +175,16 @@ def _select_faceted_numeric_cols(numeric_cols, categorical_cols, k=None):
   Args:
     numeric_cols: (iterable<str>) Available numeric columns.
     categorical_cols: (iterable<str>) Available categorical columns.
-    k: (int) The number of column pairs to select.
+    k: (int) The number of column pairs to select; at most
+      _MAX_COLNAME_COMBINATIONS pairs are selected, including when k is None.
 
   Returns:
     (iter<(str, str)>) Prioritized sequence of (numeric, categorical) column
     pairs.
   """
-  return itertools.islice(itertools.product(numeric_cols, categorical_cols), k)
+  return itertools.islice(
+      itertools.product(numeric_cols, categorical_cols), _bounded_count(k)
+  )
 
 
 def _select_time_series_cols(time_cols, numeric_cols, categorical_cols, k=None):
@@ -179,19 +194,37 @@ def _select_time_series_cols(time_cols, numeric_cols, categorical_cols, k=None):
     time_cols: (iter<str>) Available time-like columns.
     numeric_cols: (iter<str>) Available numeric columns.
     categorical_cols: (iter<str>) Available categorical columns.
-    k: (int) The number of combinations to select.
+    k: (int) The number of combinations to select; at most
+      _MAX_COLNAME_COMBINATIONS combinations are selected, including when k is
+      None.
 
   Returns:
     (iter<(str, str, str)>) Prioritized sequence of (time, value, series)
     colname combinations.
   """
-  numeric_cols = [c for c in numeric_cols if c not in time_cols]
-  numeric_aggregates = ['count()']
+  time_colnames = set(time_cols)
+  numeric_cols = [c for c in numeric_cols if c not in time_colnames]
   if not categorical_cols:
     categorical_cols = [None]
   return itertools.islice(
       itertools.product(
-          time_cols, numeric_cols + numeric_aggregates, categorical_cols
+          time_cols,
+          itertools.chain(numeric_cols, _NUMERIC_AGGREGATES),
+          categorical_cols,
       ),
-      k,
+      _bounded_count(k),
   )
+
+
+def _bounded_count(k):
+  """Caps a requested number of column combinations.
+
+  Args:
+    k: (int) The requested number of combinations, or None for no preference.
+
+  Returns:
+    (int) The number of combinations to select.
+  """
+  if k is None:
+    return _MAX_COLNAME_COMBINATIONS
+  return min(k, _MAX_COLNAME_COMBINATIONS)
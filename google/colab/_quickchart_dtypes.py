@@ -20,14 +20,21 @@ _DATETIME_COLNAME_PATTERNS = (
     'timestamp',
 )  # Prefix/suffix matches.
 _DATETIME_COLNAMES = ('dt', 't', 'ts', 'year')  # Exact matches.
+_DATETIME_COLNAMES_SET = frozenset(_DATETIME_COLNAMES)
 _EXPECTED_DTYPES = _CATEGORICAL_DTYPES + _DATETIME_DTYPES
 _CATEGORICAL_LARGE_SIZE_THRESHOLD = 8  # Facet-friendly size limit.
+_HASHABILITY_SAMPLE_SIZE = 128  # Object-dtype values inspected for hashing.
+_SCALAR_TYPES = frozenset((str, bytes, int, float, bool, complex, type(None)))
+_NON_SCALAR_TYPES = frozenset((list, tuple, set, frozenset, dict))
 
 
 def is_categorical(series):
   return (
-      series.dtype in _CATEGORICAL_DTYPES
-      and len(series.unique()) <= _CATEGORICAL_LARGE_SIZE_THRESHOLD
+      (
+          series.dtype in _CATEGORICAL_DTYPES
+          or _is_categorical_extension_dtype(series.dtype)
+      )
+      and series.nunique(dropna=False) <= _CATEGORICAL_LARGE_SIZE_THRESHOLD
   )
 
 
@@ -53,36 +60,63 @@ def classify_dtypes(
     column names.
   """
   # Lazy import to avoid loading pandas and transitive deps on kernel init.
-  import pandas as pd  # pylint: disable=g-import-not-at-top
   from pandas.api.types import is_numeric_dtype  # pylint: disable=g-import-not-at-top
 
-  dtypes = (
-      pd.DataFrame(df.dtypes, columns=['colname_dtype'])
-      .reset_index()
-      .rename(columns={'index': 'colname'})
-  )
-
   filtered_cols = []
   numeric_cols = []
   cat_cols = []
   datetime_cols = []
   timelike_cols = []
   singleton_cols = []
-  for colname, colname_dtype in zip(dtypes.colname, dtypes.colname_dtype):
-    if not all(df[colname].apply(pd.api.types.is_hashable)):
-      filtered_cols.append(colname)
-    elif len(df[colname].unique()) <= 1:
-      singleton_cols.append(colname)
-    elif colname_dtype in categorical_dtypes:
-      cat_cols.append(colname)
-    elif (colname_dtype in datetime_dtypes) or (
-        colname_dtype.kind in datetime_dtype_kinds
+  unique_counts = {}
+
+  for colname, series in df.items():
+    colname_dtype = series.dtype
+    group = None
+    is_hashable = True
+    if colname_dtype not in categorical_dtypes and _is_ordered_numpy_dtype(
+        colname_dtype
     ):
-      datetime_cols.append(colname)
-    elif is_numeric_dtype(colname_dtype):
-      numeric_cols.append(colname)
+      if _is_singleton_ordered(series):
+        group = singleton_cols
     else:
-      filtered_cols.append(colname)
+      unique_count = _count_unique(series)
+      if unique_count is None:
+        is_hashable = False
+        group = filtered_cols
+      elif unique_count <= 1:
+        group = singleton_cols
+      else:
+        unique_counts[colname] = unique_count
+
+    if group is None:
+      if (
+          colname_dtype in categorical_dtypes
+          or _is_categorical_extension_dtype(colname_dtype)
+      ):
+        group = cat_cols
+      elif (colname_dtype in datetime_dtypes) or (
+          colname_dtype.kind in datetime_dtype_kinds
+      ):
+        group = datetime_cols
+      elif is_numeric_dtype(colname_dtype):
+        group = numeric_cols
+      else:
+        group = filtered_cols
+    group.append(colname)
+
+    # Datetime columns are already usable as time axes, and only numeric
+    # columns can be monotonically increasing; other columns (e.g. dates stored
+    # as strings) are only timelike if their name suggests so. Unhashable
+    # values (lists, dicts, ...) are never scalar.
+    if is_hashable and group is not datetime_cols and (
+        (_matches_datetime_pattern(colname) and _all_values_scalar(series))
+        or (
+            group is numeric_cols
+            and _is_monotonically_increasing_numeric(series)
+        )
+    ):
+      timelike_cols.append(colname)
   if filtered_cols:
     logging.warning(
         'Quickchart encountered unexpected dtypes in columns: "%r"',
@@ -91,25 +125,11 @@ def classify_dtypes(
 
   small_cat_cols, large_cat_cols = [], []
   for colname in cat_cols:
-    if len(df[colname].unique()) <= categorical_size_threshold:
+    if unique_counts[colname] <= categorical_size_threshold:
       small_cat_cols.append(colname)
     else:
       large_cat_cols.append(colname)
 
-  def _matches_datetime_pattern(colname):
-    colname = str(colname).lower()
-    return any(
-        colname.startswith(p) or colname.endswith(p)
-        for p in _DATETIME_COLNAME_PATTERNS
-    ) or any(colname == c for c in _DATETIME_COLNAMES)
-
-  for colname in df.columns:
-    if (
-        _matches_datetime_pattern(colname)
-        or _is_monotonically_increasing_numeric(df[colname])
-    ) and _all_values_scalar(df[colname]):
-      timelike_cols.append(colname)
-
   return {
       'numeric': numeric_cols,
       'categorical': small_cat_cols,
@@ -121,20 +141,93 @@ def classify_dtypes(
   }
 
 
+def _matches_datetime_pattern(colname):
+  colname = str(colname).lower()
+  # str.startswith/endswith accept a tuple, checking all patterns in one call.
+  return (
+      colname.startswith(_DATETIME_COLNAME_PATTERNS)
+      or colname.endswith(_DATETIME_COLNAME_PATTERNS)
+      or colname in _DATETIME_COLNAMES_SET
+  )
+
+
+def _is_hashable(series):
+  # Only object columns can hold unhashable values (e.g. lists or dicts); for
+  # these, inspect a bounded sample rather than every row.
+  if series.dtype != object:
+    return True
+  # Lazy import to avoid loading pandas and transitive deps on kernel init.
+  import pandas as pd  # pylint: disable=g-import-not-at-top
+
+  sample = series.head(_HASHABILITY_SAMPLE_SIZE).dropna()
+  return all(pd.api.types.is_hashable(x) for x in sample)
+
+
+def _count_unique(series):
+  """Counts distinct values, including NaN; None if any value is unhashable."""
+  if not _is_hashable(series):
+    return None
+  try:
+    return series.nunique(dropna=False)
+  except TypeError:  # Unhashable values beyond the rows _is_hashable samples.
+    return None
+
+
+def _is_categorical_extension_dtype(dtype):
+  # Lazy import to avoid loading pandas and transitive deps on kernel init.
+  import pandas as pd  # pylint: disable=g-import-not-at-top
+
+  # Pandas extension dtypes don't compare equal to numpy's object/bool dtypes.
+  return isinstance(
+      dtype, (pd.CategoricalDtype, pd.BooleanDtype, pd.StringDtype)
+  )
+
+
+def _is_ordered_numpy_dtype(dtype):
+  # Numeric and datetime numpy dtypes support vectorized min/max reductions.
+  return isinstance(dtype, np.dtype) and dtype.kind in 'iufmM'
+
+
+def _is_singleton_ordered(series):
+  # Equivalent to `series.nunique(dropna=False) <= 1` without building a
+  # hashtable of the series values.
+  if series.hasnans:
+    return series.isna().all()
+  # Reduce the raw buffer directly, skipping pandas' NaN-aware reductions.
+  values = series.to_numpy()
+  return values.size == 0 or values.min() == values.max()
+
+
 def _is_monotonically_increasing_numeric(series):
   # Pandas extension dtypes do not extend numpy's dtype and will fail if passed
   # into issubdtype.
   if not isinstance(series.dtype, np.dtype):
     return False
-  return np.issubdtype(series.dtype.base, np.number) and np.all(
-      np.array(series)[:-1] <= np.array(series)[1:]
-  )
+  if not np.issubdtype(series.dtype.base, np.number):
+    return False
+  # Pandas doesn't support float16 indexes, which is_monotonic_increasing
+  # builds internally.
+  if series.dtype == np.float16:
+    values = series.to_numpy()
+    return bool(np.all(values[:-1] <= values[1:]))
+  return series.is_monotonic_increasing
 
 
 def _all_values_scalar(series):
   def _is_non_scalar(x):
+    # Exact type lookups avoid the comparatively slow ABC isinstance check for
+    # the most common value types.
+    t = type(x)
+    if t in _SCALAR_TYPES:
+      return False
+    if t in _NON_SCALAR_TYPES:
+      return True
     return isinstance(x, collections.abc.Iterable) and not isinstance(
         x, (bytes, str)
     )
 
-  return not any(_is_non_scalar(x) for x in series)
+  # Only object columns can hold non-scalar values.
+  if series.dtype != object:
+    return True
+  # Iterate the underlying ndarray to bypass pandas' per-element boxing.
+  return not any(_is_non_scalar(x) for x in series.values)
@@ -0,0 +1,214 @@
+# Copyright 2024 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for google.colab._quickchart_dtypes."""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from google.colab import _quickchart_dtypes
+
+
+class ClassifyDtypesTest(unittest.TestCase):
+
+  def testBasicGroups(self):
+    df = pd.DataFrame({
+        'value': [3.0, 1.0, 2.0, 5.0],
+        'label': pd.Series(['x', 'y', 'x', 'z'], dtype=object),
+        'flag': [True, False, True, True],
+        'when': pd.to_datetime(
+            ['2020-01-01', '2020-01-02', '2020-01-03', '2020-01-05']
+        ),
+        'constant': [1, 1, 1, 1],
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['numeric'], ['value'])
+    self.assertEqual(dtype_groups['categorical'], ['label', 'flag'])
+    self.assertEqual(dtype_groups['large_categorical'], [])
+    self.assertEqual(dtype_groups['datetime'], ['when'])
+    self.assertEqual(dtype_groups['singleton'], ['constant'])
+    self.assertEqual(dtype_groups['filtered'], [])
+
+  def testLargeCategorical(self):
+    df = pd.DataFrame(
+        {'label': pd.Series([str(i) for i in range(20)], dtype=object)}
+    )
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['categorical'], [])
+    self.assertEqual(dtype_groups['large_categorical'], ['label'])
+
+  def testExtensionDtypesAreCategorical(self):
+    df = pd.DataFrame({
+        'category': pd.Categorical(['p', 'q', 'p']),
+        'nullable_bool': pd.array([True, None, False], dtype='boolean'),
+        'string': pd.array(['a', 'b', 'a'], dtype='string'),
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(
+        dtype_groups['categorical'], ['category', 'nullable_bool', 'string']
+    )
+    self.assertEqual(dtype_groups['filtered'], [])
+
+  def testUnhashableValuesAreFiltered(self):
+    df = pd.DataFrame({'a': pd.Series([[1], [2], [3]], dtype=object)})
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['filtered'], ['a'])
+    self.assertEqual(dtype_groups['timelike'], [])
+
+  def testUnhashableValueAfterHashabilitySampleIsFiltered(self):
+    df = pd.DataFrame({
+        'a': pd.Series(['x'] * 200 + [[1, 2]], dtype=object),
+        'b': range(201),
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['filtered'], ['a'])
+    self.assertEqual(dtype_groups['numeric'], ['b'])
+
+  def testDatetimeColumnIsNotAlsoTimelike(self):
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03']),
+        'value': [3.0, 1.0, 2.0],
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['datetime'], ['date'])
+    self.assertEqual(dtype_groups['timelike'], [])
+
+  def testTimelikeColumns(self):
+    df = pd.DataFrame({
+        'index': [1, 2, 3, 4],
+        'year': [2003, 2001, 2002, 2000],
+        'day': pd.Series(
+            ['2020-01-01', '2020-01-02', '2020-01-03', '2020-01-04'],
+            dtype=object,
+        ),
+        'value': [3.0, 1.0, 2.0, 5.0],
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    # Monotonically increasing numeric values or datetime-like names.
+    self.assertEqual(dtype_groups['timelike'], ['index', 'year'])
+
+  def testDateStringsWithDatetimeNameAreTimelike(self):
+    df = pd.DataFrame({
+        'date': pd.Series(
+            ['2020-01-02', '2020-01-01', '2020-01-03'], dtype=object
+        )
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['categorical'], ['date'])
+    self.assertEqual(dtype_groups['timelike'], ['date'])
+
+  def testConstantColumnIsNotTimelike(self):
+    df = pd.DataFrame({'constant': [1, 1, 1, 1], 'value': [3.0, 1.0, 2.0, 5.0]})
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['singleton'], ['constant'])
+    self.assertEqual(dtype_groups['timelike'], [])
+
+  def testSingletonWithMissingValues(self):
+    df = pd.DataFrame({
+        'all_nan': [np.nan, np.nan, np.nan],
+        'value_and_nan': [1.0, np.nan, 1.0],
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['singleton'], ['all_nan'])
+    self.assertEqual(dtype_groups['numeric'], ['value_and_nan'])
+
+  def testReassignedColumnIsReclassified(self):
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [3.0, 1.0, 2.0]})
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+    self.assertEqual(dtype_groups['numeric'], ['a', 'b'])
+
+    df['b'] = 5.0
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+    self.assertEqual(dtype_groups['numeric'], ['a'])
+    self.assertEqual(dtype_groups['singleton'], ['b'])
+
+    df['c'] = pd.Series(['x', 'y', 'z'], dtype=object)
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+    self.assertEqual(dtype_groups['large_categorical'], [])
+    self.assertEqual(dtype_groups['categorical'], ['c'])
+
+    df['c'] = pd.Series([[1], [2], [3]], dtype=object)
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+    self.assertEqual(dtype_groups['categorical'], [])
+    self.assertEqual(dtype_groups['filtered'], ['c'])
+
+  def testLargeDataframeUsesAllRows(self):
+    n = 200_000
+    nearly_constant = np.zeros(n)
+    nearly_constant[123_456] = 1.0
+    nearly_sorted = np.arange(n)
+    nearly_sorted[150_000] = 0
+    date_strings = pd.Series(
+        ['2020-01-01', '2020-01-02'] * (n // 2), dtype=object
+    )
+    date_strings.iloc[-1] = [1]
+    df = pd.DataFrame({
+        'nearly_constant': nearly_constant,
+        'nearly_sorted': nearly_sorted,
+        'sorted': np.arange(n),
+        'date': date_strings,
+    })
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(
+        dtype_groups['numeric'], ['nearly_constant', 'nearly_sorted', 'sorted']
+    )
+    self.assertEqual(dtype_groups['singleton'], [])
+    self.assertEqual(dtype_groups['timelike'], ['sorted'])
+    self.assertEqual(dtype_groups['filtered'], ['date'])
+
+  def testFloat16Column(self):
+    df = pd.DataFrame({'x': np.array([1, 2, 3], dtype=np.float16)})
+
+    dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+    self.assertEqual(dtype_groups['numeric'], ['x'])
+    self.assertEqual(dtype_groups['timelike'], ['x'])
+
+  def testHashableNonScalarValueIsNotTimelike(self):
+    for position in (0, 100, 20_000, 30_000):
+      values = ['2020-01-01'] * 30_001
+      values[position] = (1, 2)
+      df = pd.DataFrame({'date': pd.Series(values, dtype=object)})
+
+      dtype_groups = _quickchart_dtypes.classify_dtypes(df)
+
+      with self.subTest(position=position):
+        self.assertEqual(dtype_groups['timelike'], [])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,65 @@
+# Copyright 2024 Google Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for google.colab._quickchart."""
+
+import unittest
+
+from google.colab import _quickchart
+
+
+class ColnameSelectionTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.colnames = [f'c{i}' for i in range(100)]
+
+  def testFirstKPairs(self):
+    self.assertEqual(
+        list(_quickchart._select_first_k_pairs(['a', 'b', 'c'], k=2)),
+        [('a', 'b'), ('b', 'c')],
+    )
+
+  def testFirstKPairsIsBoundedWithoutK(self):
+    pairs = list(_quickchart._select_first_k_pairs(self.colnames))
+    self.assertEqual(len(pairs), _quickchart._MAX_COLNAME_COMBINATIONS)
+
+  def testFacetedNumericColsIsBounded(self):
+    pairs = list(
+        _quickchart._select_faceted_numeric_cols(
+            self.colnames, self.colnames, k=1000
+        )
+    )
+    self.assertEqual(len(pairs), _quickchart._MAX_COLNAME_COMBINATIONS)
+
+  def testTimeSeriesColsIsBoundedWithoutK(self):
+    combinations = list(
+        _quickchart._select_time_series_cols(
+            time_cols=self.colnames,
+            numeric_cols=self.colnames,
+            categorical_cols=[],
+        )
+    )
+    self.assertEqual(len(combinations), _quickchart._MAX_COLNAME_COMBINATIONS)
+
+  def testTimeSeriesColsExcludesTimeColsFromValues(self):
+    combinations = list(
+        _quickchart._select_time_series_cols(
+            time_cols=['t'], numeric_cols=['t', 'v'], categorical_cols=[]
+        )
+    )
+    self.assertEqual(combinations, [('t', 'v', None), ('t', 'count()', None)])
+
+
+if __name__ == '__main__':
+  unittest.main()